@@ -0,0 +1,7 @@
+"""Prompt wrangler: NER keyword extraction from medical texts."""
+
+from loguru import logger
+
+# Library convention for loguru: stay silent until the application opts in,
+# since debug records include prompts and sample texts. setup_logger enables it.
+logger.disable("app")
@@ -1,18 +1,18 @@
 """Main entry point for the prompt wrangler CLI application."""
 
+import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 from loguru import logger
-from rich.prompt import Prompt
+from pydantic import TypeAdapter
 
 from app.models.config import settings
-from app.models.input import ModelParameters, ProcessingInput, PromptInput
-from app.services.openai_service import OpenAIService
+from app.models.input import ProcessingInput
 from app.utils.cli import (
-    console,
     display_results,
+    get_console,
     print_error,
     print_welcome_message,
     read_file_contents,
@@ -20,6 +20,39 @@ from app.utils.cli import (
 from app.utils.logging import setup_logger
 
 
+# Validators for processing inputs, built once and reused for every invocation
+_PROCESSING_INPUT_ADAPTER = TypeAdapter(ProcessingInput)
+_PROCESSING_INPUTS_ADAPTER = TypeAdapter(List[ProcessingInput])
+
+# Options shared by the extract commands
+SYSTEM_PROMPT_OPTION = typer.Option(
+    None, "--system", "-s", help="System prompt for context setting"
+)
+SYSTEM_FILE_OPTION = typer.Option(
+    None, "--system-file", "-sf", help="File containing the system prompt"
+)
+USER_PROMPT_OPTION = typer.Option(
+    None, "--user", "-u", help="User prompt with specific instructions"
+)
+USER_FILE_OPTION = typer.Option(
+    None, "--user-file", "-uf", help="File containing the user prompt"
+)
+MODEL_OPTION = typer.Option(
+    settings.default_model, "--model", "-m", help="OpenAI model to use"
+)
+TEMPERATURE_OPTION = typer.Option(
+    settings.default_temperature, "--temperature", "-temp", help="Temperature setting (0-1)"
+)
+MAX_TOKENS_OPTION = typer.Option(
+    settings.default_max_tokens, "--max-tokens", "-mt", help="Maximum tokens in response"
+)
+API_KEY_OPTION = typer.Option(
+    None, "--api-key", "-k", help="OpenAI API key (overrides env variable)"
+)
+STRICT_OPTION = typer.Option(
+    False, "--strict", help="Run full Pydantic validation on extracted entities"
+)
+
 # Create Typer application
 app = typer.Typer(
     help="🤖 Prompt Wrangler: A tool for NER keyword extraction from medical texts",
@@ -40,18 +73,10 @@ def callback(
 @app.command(name="extract")
 def extract_entities(
     # Prompt inputs
-    system_prompt: Optional[str] = typer.Option(
-        None, "--system", "-s", help="System prompt for context setting"
-    ),
-    system_file: Optional[Path] = typer.Option(
-        None, "--system-file", "-sf", help="File containing the system prompt"
-    ),
-    user_prompt: Optional[str] = typer.Option(
-        None, "--user", "-u", help="User prompt with specific instructions"
-    ),
-    user_file: Optional[Path] = typer.Option(
-        None, "--user-file", "-uf", help="File containing the user prompt"
-    ),
+    system_prompt: Optional[str] = SYSTEM_PROMPT_OPTION,
+    system_file: Optional[Path] = SYSTEM_FILE_OPTION,
+    user_prompt: Optional[str] = USER_PROMPT_OPTION,
+    user_file: Optional[Path] = USER_FILE_OPTION,
     text: Optional[str] = typer.Option(
         None, "--text", "-t", help="Sample text to extract entities from"
     ),
@@ -60,20 +85,15 @@ def extract_entities(
     ),
     
     # Model parameters
-    model: str = typer.Option(
-        settings.default_model, "--model", "-m", help="OpenAI model to use"
-    ),
-    temperature: float = typer.Option(
-        settings.default_temperature, "--temperature", "-temp", help="Temperature setting (0-1)"
-    ),
-    max_tokens: int = typer.Option(
-        settings.default_max_tokens, "--max-tokens", "-mt", help="Maximum tokens in response"
-    ),
+    model: str = MODEL_OPTION,
+    temperature: float = TEMPERATURE_OPTION,
+    max_tokens: int = MAX_TOKENS_OPTION,
     
     # API key
-    api_key: Optional[str] = typer.Option(
-        None, "--api-key", "-k", help="OpenAI API key (overrides env variable)"
-    ),
+    api_key: Optional[str] = API_KEY_OPTION,
+    
+    # Output validation
+    strict: bool = STRICT_OPTION,
     
     # Interactive mode flag
     interactive: bool = typer.Option(
@@ -97,13 +117,15 @@ def extract_entities(
         
         # Gather inputs: interactive or from arguments
         if interactive:
+            from rich.prompt import Prompt
+            
             system_prompt_text = Prompt.ask("[bold]Enter system prompt[/bold]")
             user_prompt_text = Prompt.ask("[bold]Enter user prompt[/bold]")
             sample_text = Prompt.ask("[bold]Enter sample text[/bold]")
         else:
             # Get system prompt
             if system_file:
-                system_prompt_text = read_file_contents(str(system_file))
+                system_prompt_text = read_file_contents(system_file)
             elif system_prompt:
                 system_prompt_text = system_prompt
             else:
@@ -112,7 +134,7 @@ def extract_entities(
                 
             # Get user prompt
             if user_file:
-                user_prompt_text = read_file_contents(str(user_file))
+                user_prompt_text = read_file_contents(user_file)
             elif user_prompt:
                 user_prompt_text = user_prompt
             else:
@@ -121,34 +143,32 @@ def extract_entities(
                 
             # Get sample text
             if text_file:
-                sample_text = read_file_contents(str(text_file))
+                sample_text = read_file_contents(text_file)
             elif text:
                 sample_text = text
             else:
                 print_error("Sample text is required. Provide it with --text or --text-file.")
                 raise typer.Exit(code=1)
         
-        # Create input models
-        prompt_input = PromptInput(
-            system_prompt=system_prompt_text,
-            user_prompt=user_prompt_text,
-            sample_text=sample_text,
-        )
-        
-        model_parameters = ModelParameters(
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        # Create input models in a single validation pass
+        processing_input = _PROCESSING_INPUT_ADAPTER.validate_python({
+            "prompt": {
+                "system_prompt": system_prompt_text,
+                "user_prompt": user_prompt_text,
+                "sample_text": sample_text,
+            },
+            "parameters": {
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+        })
         
-        processing_input = ProcessingInput(
-            prompt=prompt_input,
-            parameters=model_parameters,
-        )
+        # Process with OpenAI, importing the client only once it is needed
+        from app.services.openai_service import OpenAIService
         
-        # Process with OpenAI
-        console.print("\n[bold yellow]🔄 Processing request...[/bold yellow]")
-        service = OpenAIService(api_key=openai_api_key)
+        get_console().print("\n[bold yellow]🔄 Processing request...[/bold yellow]")
+        service = OpenAIService(api_key=openai_api_key, strict=strict)
         result = service.process_prompt(processing_input)
         
         # Display results
@@ -163,5 +183,139 @@ def extract_entities(
         raise typer.Exit(code=1)
 
 
-if __name__ == "__main__":
+def _read_batch_inputs(
+    inputs_file: Path,
+    system_prompt: Optional[str],
+    user_prompt: Optional[str],
+    model_parameters: Dict[str, Any],
+) -> List[ProcessingInput]:
+    """Read processing inputs for a batch from a JSONL file.
+    
+    Args:
+        inputs_file: JSONL file with one {"sample_text": ...} object per line
+        system_prompt: System prompt for lines that do not set their own
+        user_prompt: User prompt for lines that do not set their own
+        model_parameters: Model parameters shared by every input
+    
+    Returns:
+        Validated processing inputs, one per non-empty line
+    """
+    payloads = []
+    for line in read_file_contents(inputs_file).splitlines():
+        if not line.strip():
+            continue
+        
+        item = json.loads(line)
+        payloads.append({
+            "prompt": {
+                "system_prompt": item.get("system_prompt", system_prompt or ""),
+                "user_prompt": item.get("user_prompt", user_prompt or ""),
+                "sample_text": item.get("sample_text", ""),
+            },
+            "parameters": model_parameters,
+        })
+    
+    # Validate every input in a single pass
+    return _PROCESSING_INPUTS_ADAPTER.validate_python(payloads)
+
+
+@app.command(name="extract-batch")
+def extract_entities_batch(
+    # Prompt inputs
+    system_prompt: Optional[str] = SYSTEM_PROMPT_OPTION,
+    system_file: Optional[Path] = SYSTEM_FILE_OPTION,
+    user_prompt: Optional[str] = USER_PROMPT_OPTION,
+    user_file: Optional[Path] = USER_FILE_OPTION,
+    inputs_file: Optional[Path] = typer.Option(
+        None, "--inputs-file", "-if", help="JSONL file with one {\"sample_text\": ...} object per line"
+    ),
+    
+    # Resume an earlier batch instead of submitting a new one
+    batch_id: Optional[str] = typer.Option(
+        None, "--batch-id", "-b", help="ID of a submitted batch to wait for and download"
+    ),
+    
+    # Model parameters
+    model: str = MODEL_OPTION,
+    temperature: float = TEMPERATURE_OPTION,
+    max_tokens: int = MAX_TOKENS_OPTION,
+    
+    # API key
+    api_key: Optional[str] = API_KEY_OPTION,
+    
+    # Output validation
+    strict: bool = STRICT_OPTION,
+) -> None:
+    """Extract named entities from many texts using the OpenAI Batch API.
+    
+    Each line of the inputs file is a JSON object with a sample_text field and may
+    override system_prompt or user_prompt. Batch jobs cost half as much as regular
+    requests but can take up to 24 hours to complete. A batch whose wait was
+    interrupted can be resumed with --batch-id.
+    """
+    print_welcome_message()
+    
+    try:
+        # Get API key
+        openai_api_key = api_key or settings.openai_api_key
+        
+        if not openai_api_key:
+            print_error("OpenAI API key is required. Set it with --api-key or OPENAI_API_KEY environment variable.")
+            raise typer.Exit(code=1)
+        
+        # Import the client only once it is needed
+        from app.services.openai_service import OpenAIService
+        
+        service = OpenAIService(api_key=openai_api_key, strict=strict)
+        
+        if batch_id:
+            get_console().print(f"\n[bold yellow]🔄 Waiting for batch {batch_id}...[/bold yellow]")
+        else:
+            if not inputs_file:
+                print_error("Inputs are required. Provide them with --inputs-file, or resume a batch with --batch-id.")
+                raise typer.Exit(code=1)
+            
+            inputs = _read_batch_inputs(
+                inputs_file,
+                read_file_contents(system_file) if system_file else system_prompt,
+                read_file_contents(user_file) if user_file else user_prompt,
+                {"model": model, "temperature": temperature, "max_tokens": max_tokens},
+            )
+            
+            if not inputs:
+                print_error(f"No inputs found in {inputs_file}.")
+                raise typer.Exit(code=1)
+            
+            # Submit the batch, printing its ID so an interrupted wait can be resumed
+            batch_id = service.submit_batch(inputs)
+            get_console().print(
+                f"\n[bold yellow]🔄 Waiting for batch {batch_id} ({len(inputs)} requests)...[/bold yellow]\n"
+                f"If interrupted, resume with --batch-id {batch_id}"
+            )
+        
+        results = service.wait_for_batch(batch_id)
+        
+        # Display results
+        for index, result in enumerate(results):
+            get_console().print(f"\n[bold]Input {index + 1}[/bold]")
+            if result is None:
+                print_error("Request failed, see logs for details.")
+            else:
+                display_results(result)
+        
+    except typer.Exit:
+        # Errors have already been reported, keep the exit code for scripts
+        raise
+    except Exception as e:
+        logger.exception("An error occurred")
+        print_error(f"An unexpected error occurred: {e}")
+        raise typer.Exit(code=1)
+
+
+def main() -> None:
+    """Run the prompt wrangler CLI."""
     app()
+
+
+if __name__ == "__main__":
+    main()
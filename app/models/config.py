@@ -2,17 +2,33 @@
 
 # No type imports needed
 
-from dotenv import find_dotenv, load_dotenv
+from pathlib import Path
+
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
 
 
-# Load environment variables from .env file
-load_dotenv(find_dotenv())
+def _find_env_file() -> str:
+    """Find the nearest .env file in this module's directory or its parents.
+    
+    Returns:
+        Path to the .env file, or ".env" in the working directory if none is found
+    """
+    for directory in Path(__file__).resolve().parents:
+        env_file = directory / ".env"
+        if env_file.is_file():
+            return str(env_file)
+    return ".env"
 
 
 class Settings(BaseSettings):
-    """Application settings including API keys and default parameters."""
+    """Application settings including API keys and default parameters.
+    
+    Values are read from environment variables and the .env file, which
+    pydantic-settings parses once when the settings are created. The .env file
+    is searched for upwards from this module, so runs from any working
+    directory use the project's configuration.
+    """
 
     # OpenAI API settings
     openai_api_key: str = Field(
@@ -37,8 +53,15 @@ class Settings(BaseSettings):
         gt=0
     )
 
+    # Batch processing settings
+    max_concurrency: int = Field(
+        default=10,
+        description="Maximum number of concurrent requests when processing a batch",
+        gt=0
+    )
+
     model_config = ConfigDict(
-        env_file=".env",
+        env_file=_find_env_file(),
         env_file_encoding="utf-8",
         case_sensitive=False,
     )
@@ -1,9 +1,9 @@
 """Output models for the prompt wrangler."""
 
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, computed_field
 
 
 class EntityOutput(BaseModel):
@@ -25,13 +25,22 @@ class TokenUsage(BaseModel):
 
 
 class ResponseMetrics(BaseModel):
-    """Metrics for API response including timing and token usage."""
+    """Metrics for API response including timing and token usage.
+    
+    The response time is measured with a monotonic clock, so the end time is
+    derived from it rather than stored as a second timestamp.
+    """
     
     start_time: datetime = Field(description="Request start time")
-    end_time: datetime = Field(description="Request end time")
     response_time_ms: int = Field(description="Response time in milliseconds")
     token_usage: TokenUsage = Field(description="Token usage metrics")
     model: str = Field(description="Model used for the request")
+    
+    @computed_field(description="Request end time")
+    @property
+    def end_time(self) -> datetime:
+        """Request end time, derived from the start time and response time."""
+        return self.start_time + timedelta(milliseconds=self.response_time_ms)
 
 
 class ProcessingOutput(BaseModel):
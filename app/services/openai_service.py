@@ -1,30 +1,141 @@
 """OpenAI API integration service."""
 
+import asyncio
+import time
 from datetime import datetime
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Any, Coroutine, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
-import instructor
+import httpx
+import orjson
 from loguru import logger
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from app.models.config import settings
-from app.models.input import ProcessingInput
+from app.models.input import ModelParameters, ProcessingInput, PromptInput
 from app.models.output import EntityOutput, ProcessingOutput
-from app.utils.metrics import create_response_metrics
+from app.utils.metrics import calculate_response_time, create_response_metrics
+
+
+T = TypeVar("T")
+
+# Retry policy for chat completion calls. The OpenAI client already retries
+# briefly on its own; this adds longer, jittered backoff so a sustained rate
+# limit or outage fails one request late rather than a whole batch early.
+_retry_transient_errors = retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+    wait=wait_random_exponential(multiplier=1, max=20),
+    stop=stop_after_attempt(3),
+    before_sleep=lambda state: logger.warning(
+        f"Retrying OpenAI request after error: {state.outcome.exception()}"
+    ),
+    reraise=True,
+)
+
+# Endpoint targeted by every request in a Batch API input file
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Batch statuses after which the batch will not make further progress
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Upper bound on max_tokens for a request packing several samples, the output
+# limit of current models; chunks that still run out are split and sent again
+MULTI_SAMPLE_MAX_TOKENS = 16384
+
+# Instructions appended to the user prompt when several samples share one request
+MULTI_SAMPLE_INSTRUCTIONS = (
+    "The input texts below are numbered [0] to [{last}]. Return a JSON array of length "
+    "{count} where element i is the JSON object extracted from input text [i]."
+)
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.Client:
+    """HTTP client shared by every OpenAIService so connections are reused.
+    
+    Returns:
+        HTTP/2 enabled client with the OpenAI SDK's default timeouts and pool limits
+    """
+    return DefaultHttpxClient(http2=True)
+
+
+def _extract_json(text: str, opening: str = "{") -> Optional[str]:
+    """Find the first complete JSON object or array in a text.
+    
+    Scans once from the first ``opening`` bracket, tracking nesting depth and
+    string literals, so nested values and braces inside strings are handled
+    and any surrounding prose or markdown code block markers are skipped.
+    
+    Args:
+        text: Text that may contain JSON
+        opening: "{" to find an object, "[" to find an array
+    
+    Returns:
+        The JSON substring, or None if no balanced value was found
+    """
+    start = text.find(opening)
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{" or c == "[":
+            depth += 1
+        elif c == "}" or c == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
 
 
 class OpenAIService:
     """Service for interacting with OpenAI API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        strict: bool = False,
+        client: Optional[OpenAI] = None,
+        aclient: Optional[AsyncOpenAI] = None,
+    ):
         """Initialize the OpenAI service.
         
         Args:
             api_key: Optional API key, uses the one from settings if not provided
+            strict: Run full Pydantic validation on extracted entities
+            client: Optional preconfigured client, created from the API key if not provided
+            aclient: Optional preconfigured async client for the batch and multi-sample
+                paths, created from the API key if not provided. The caller owns it
+                and is responsible for closing it
         """
         self.api_key = api_key or settings.openai_api_key
-        self.client = self._create_client()
-        self.client_with_schema = instructor.patch(self.client)
+        self.strict = strict
+        self.client = client or self._create_client()
+        self._injected_aclient = aclient
+        self._aclient: Optional[AsyncOpenAI] = aclient
     
     def _create_client(self) -> OpenAI:
         """Create and configure OpenAI client.
@@ -36,22 +147,354 @@ class OpenAIService:
             logger.error("OpenAI API key is not set")
             raise ValueError("OpenAI API key is required")
         
-        return OpenAI(api_key=self.api_key)
+        return OpenAI(api_key=self.api_key, http_client=_shared_http_client())
+    
+    @cached_property
+    def client_with_schema(self) -> OpenAI:
+        """OpenAI client patched by instructor for structured output.
+        
+        Created on first access, since patching is only needed by callers that
+        request a response model.
+        
+        Returns:
+            Instructor-patched OpenAI client
+        """
+        import instructor
+        
+        return instructor.patch(self.client)
+    
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async OpenAI client, created on first use by the batch path.
+        
+        Unlike the sync client, its HTTP client is not shared between services,
+        because async connections are bound to the event loop that opened them.
+        
+        Returns:
+            Configured AsyncOpenAI client
+        
+        Raises:
+            ValueError: If no async client was injected and no API key is set
+        """
+        if self._aclient is None:
+            if not self.api_key:
+                logger.error("OpenAI API key is not set")
+                raise ValueError(
+                    "OpenAI API key is required for the async client; pass aclient "
+                    "alongside an injected client"
+                )
+            self._aclient = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(http2=True),
+            )
+        return self._aclient
+    
+    def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion on a new event loop.
+        
+        The async client is closed afterwards, since its connections cannot be
+        reused once the loop that opened them has finished. An injected async
+        client is left open for its owner to close.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Result of the coroutine
+        """
+        async def run() -> T:
+            try:
+                return await coro
+            finally:
+                if self._aclient is not None and self._aclient is not self._injected_aclient:
+                    await self._aclient.close()
+                    self._aclient = None
+        
+        return asyncio.run(run())
+    
+    @_retry_transient_errors
+    def _stream_api(self, **kwargs: Any) -> Tuple[str, Dict[str, int]]:
+        """Stream a chat completion and collect it, retrying transient API errors.
+        
+        Sending the request and reading the streamed body are retried as one
+        unit, so a connection dropped mid-stream starts the request over. httpx
+        errors raised while reading are converted to the SDK's connection and
+        timeout errors, which the retry policy handles.
+        
+        Args:
+            **kwargs: Arguments for the chat completions API
+        
+        Returns:
+            Message content and token usage, usage empty if not reported
+        """
+        stream = self.client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True}, **kwargs
+        )
+        try:
+            return self._read_stream(stream)
+        except httpx.TimeoutException as e:
+            raise APITimeoutError(request=e.request) from e
+        except httpx.TransportError as e:
+            raise APIConnectionError(message=str(e), request=e.request) from e
+    
+    @_retry_transient_errors
+    async def _acall_api(
+        self, semaphore: asyncio.Semaphore, **kwargs: Any
+    ) -> Tuple[Any, datetime, int]:
+        """Create a chat completion on the async client, retrying transient API errors.
+        
+        The semaphore is held for each attempt only, not while backing off between
+        attempts, so a retrying request does not hold up the others.
+        
+        Args:
+            semaphore: Semaphore limiting the number of in-flight requests
+            **kwargs: Arguments for the chat completions API
+        
+        Returns:
+            Chat completion returned by the async OpenAI client, with the start
+            time and response time in milliseconds of the successful attempt
+        """
+        async with semaphore:
+            start_time = datetime.now()
+            start_ns = time.perf_counter_ns()
+            raw_response = await self.aclient.chat.completions.create(**kwargs)
+            return raw_response, start_time, calculate_response_time(start_ns, time.perf_counter_ns())
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _system_message(system_prompt: str) -> Dict[str, str]:
+        """Build the system message for a system prompt.
+        
+        Batches usually share one system prompt, so the message is built once
+        and reused by reference. Callers must not modify it.
+        
+        Args:
+            system_prompt: System prompt for LLM context setting
+        
+        Returns:
+            System chat message
+        """
+        return {"role": "system", "content": system_prompt}
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _user_prefix(user_prompt: str) -> str:
+        """Build the part of the user message that precedes the sample text.
+        
+        Args:
+            user_prompt: User prompt providing specific instructions
+        
+        Returns:
+            User message prefix
+        """
+        return f"{user_prompt}\n\nInput Text: "
+    
+    @classmethod
+    def _build_messages(cls, prompt: PromptInput) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt.
+        
+        Args:
+            prompt: Prompt input with system prompt, user prompt and sample text
+        
+        Returns:
+            List of chat messages for the completions API
+        """
+        return [
+            cls._system_message(prompt.system_prompt),
+            {"role": "user", "content": cls._user_prefix(prompt.user_prompt) + prompt.sample_text},
+        ]
+    
+    @classmethod
+    def _build_multi_messages(
+        cls, system_prompt: str, user_prompt: str, samples: List[str]
+    ) -> List[Dict[str, str]]:
+        """Build chat messages that pack several samples into one request.
+        
+        Args:
+            system_prompt: System prompt for context setting
+            user_prompt: User prompt with specific instructions
+            samples: Sample texts to number and include in the user message
+        
+        Returns:
+            List of chat messages for the completions API
+        """
+        instructions = MULTI_SAMPLE_INSTRUCTIONS.format(last=len(samples) - 1, count=len(samples))
+        numbered = "\n\n".join(f"[{i}] {sample}" for i, sample in enumerate(samples))
+        return [
+            cls._system_message(system_prompt),
+            {"role": "user", "content": f"{user_prompt}\n\n{instructions}\n\nInput Texts:\n{numbered}"},
+        ]
+    
+    def _build_request(self, input_data: ProcessingInput) -> Dict[str, Any]:
+        """Build the chat completions request body for an input.
+        
+        Args:
+            input_data: Processing input with prompt and parameters
+        
+        Returns:
+            Keyword arguments for the chat completions API
+        """
+        return {
+            "model": input_data.parameters.model,
+            "messages": self._build_messages(input_data.prompt),
+            "temperature": input_data.parameters.temperature,
+            "max_tokens": input_data.parameters.max_tokens,
+        }
+    
+    @staticmethod
+    def _parse_entities(
+        raw_content: str, strict: bool = False
+    ) -> Tuple[EntityOutput, Dict[str, Any]]:
+        """Parse the JSON object in a model response into an EntityOutput.
+        
+        EntityOutput has no declared fields or validators, so unless ``strict``
+        is set the model is built with ``model_construct`` and skips validation.
+        
+        Args:
+            raw_content: Raw message content returned by the model
+            strict: Run full Pydantic validation on the extracted entities
+        
+        Returns:
+            Extracted entities and the parsed JSON they were built from, both
+            empty if no valid JSON was found
+        """
+        # Extract the JSON object from any surrounding text or code block markers
+        json_str = _extract_json(raw_content) or raw_content
+        
+        try:
+            # Parse JSON and create EntityOutput
+            logger.debug("Extracted JSON string: {}", json_str)
+            entity_data = orjson.loads(json_str)
+            if strict:
+                response = EntityOutput(**entity_data)
+            else:
+                response = EntityOutput.model_construct(**entity_data)
+            logger.opt(lazy=True).debug("Created EntityOutput: {}", lambda: response.model_dump())
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from response: {e}")
+            # Create an empty EntityOutput
+            entity_data = {}
+            response = EntityOutput()
+        
+        return response, entity_data
+    
+    @staticmethod
+    def _parse_entity_list(raw_content: str, count: int, strict: bool = False) -> List[EntityOutput]:
+        """Parse the JSON array in a model response into EntityOutputs.
+        
+        Args:
+            raw_content: Raw message content returned by the model
+            count: Number of samples the response should contain
+            strict: Run full Pydantic validation on the extracted entities
+        
+        Returns:
+            Exactly ``count`` extracted entities, empty for missing or invalid elements
+        """
+        # Extract the JSON array from any surrounding text or code block markers
+        json_str = _extract_json(raw_content, "[") or raw_content
+        
+        try:
+            entity_data = orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from response: {e}")
+            entity_data = []
+        
+        if not isinstance(entity_data, list):
+            logger.error("Expected a JSON array in multi-sample response")
+            entity_data = []
+        if len(entity_data) != count:
+            logger.warning(f"Expected {count} results in multi-sample response, got {len(entity_data)}")
+        
+        entity_data = entity_data[:count] + [{}] * (count - len(entity_data))
+        build = EntityOutput if strict else EntityOutput.model_construct
+        return [build(**item) if isinstance(item, dict) else build() for item in entity_data]
+    
+    @staticmethod
+    def _read_completion(raw_response: Any) -> Tuple[str, Dict[str, int]]:
+        """Get the message content and token usage of a chat completion.
+        
+        Args:
+            raw_response: Chat completion returned by the OpenAI client
+        
+        Returns:
+            Message content and token usage, usage empty if not reported
+        """
+        raw_content = raw_response.choices[0].message.content
+        
+        # Get usage data from response if available
+        usage = {}
+        if hasattr(raw_response, "usage"):
+            usage = raw_response.usage.model_dump() if hasattr(raw_response.usage, "model_dump") else {}
+        
+        return raw_content, usage
+    
+    @staticmethod
+    def _read_stream(stream: Iterable[Any]) -> Tuple[str, Dict[str, int]]:
+        """Collect the message content and token usage of a streamed chat completion.
+        
+        Args:
+            stream: Chunks of a chat completion requested with ``include_usage``
+        
+        Returns:
+            Message content and token usage, usage empty if not reported
+        """
+        parts = []
+        usage = {}
+        for chunk in stream:
+            if chunk.choices:
+                parts.append(chunk.choices[0].delta.content or "")
+            # Usage is reported on the final chunk, which has no choices
+            if chunk.usage is not None:
+                usage = chunk.usage.model_dump()
+        
+        return "".join(parts), usage
+    
+    def _build_output(
+        self,
+        raw_content: str,
+        usage: Dict[str, int],
+        model: str,
+        start_time: datetime,
+        response_time_ms: int,
+    ) -> ProcessingOutput:
+        """Convert a model response into a ProcessingOutput.
+        
+        Args:
+            raw_content: Message content returned by the model
+            usage: Token usage reported for the request
+            model: Model name used for the request
+            start_time: Time the request was sent
+            response_time_ms: Time taken by the request in milliseconds
+        
+        Returns:
+            Processing output with structured data and metrics
+        """
+        logger.debug("Raw response content: {}", raw_content)
+        
+        response, entity_data = self._parse_entities(raw_content, self.strict)
+        
+        # Create metrics
+        metrics = create_response_metrics(start_time, response_time_ms, usage, model)
+        
+        # Fields are already validated models, and the parsed JSON doubles as the
+        # raw response, so skip validating and dumping them a second time
+        return ProcessingOutput.model_construct(
+            result=response,
+            metrics=metrics,
+            raw_response=entity_data,
+        )
     
     def process_prompt(self, input_data: ProcessingInput) -> ProcessingOutput:
         """Process a prompt using OpenAI API and return structured output.
         
         Args:
             input_data: Processing input with prompt and parameters
-            
+        
         Returns:
             Processing output with structured data and metrics
         """
         # Prepare the request messages
-        messages = [
-            {"role": "system", "content": input_data.prompt.system_prompt},
-            {"role": "user", "content": f"{input_data.prompt.user_prompt}\n\nInput Text: {input_data.prompt.sample_text}"},
-        ]
+        messages = self._build_messages(input_data.prompt)
         
         # Set request parameters
         model = input_data.parameters.model
@@ -60,72 +503,389 @@ class OpenAIService:
         
         logger.info(f"Processing prompt with model: {model}, temperature: {temperature}")
         
-        # Record start time
+        # Record start time, wall clock for display and a monotonic counter for the duration
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Log the request details
-            logger.debug(f"Sending prompt to OpenAI: {messages}")
-            logger.debug(f"Using model {model} with temperature {temperature} and max_tokens {max_tokens}")
+            logger.debug("Sending prompt to OpenAI: {}", messages)
+            logger.debug(
+                "Using model {} with temperature {} and max_tokens {}", model, temperature, max_tokens
+            )
             
-            # Call OpenAI API
-            raw_response = self.client.chat.completions.create(
+            # Call OpenAI API, streaming so the response is read as it arrives
+            raw_content, usage = self._stream_api(
                 model=model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
             
-            # Extract raw content from response
-            raw_content = raw_response.choices[0].message.content
-            logger.debug(f"Raw response content: {raw_content}")
+            # Record response time
+            response_time_ms = calculate_response_time(start_ns, time.perf_counter_ns())
             
-            # Process the response content
-            import json
-            import re
-            
-            # Clean the raw content from any markdown code block markers
-            pattern = r'```(?:json)?\s*({[\s\S]*?})\s*```'
-            match = re.search(pattern, raw_content)
-            if match:
-                json_str = match.group(1)
-            else:
-                # If not found in code block, try to extract any JSON from response
-                pattern = r'{[\s\S]*?}'
-                match = re.search(pattern, raw_content)
-                if match:
-                    json_str = match.group(0)
-                else:
-                    json_str = raw_content
-                    
-            try:
-                # Parse JSON and create EntityOutput
-                logger.debug(f"Extracted JSON string: {json_str}")
-                entity_data = json.loads(json_str)
-                response = EntityOutput(**entity_data)
-                logger.debug(f"Created EntityOutput: {response.model_dump()}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON from response: {e}")
-                # Create an empty EntityOutput
-                response = EntityOutput()
-            
-            # Record end time
-            end_time = datetime.now()
-            
-            # Get usage data from response if available
-            usage = {}
-            if hasattr(raw_response, "usage"):
-                usage = raw_response.usage.model_dump() if hasattr(raw_response.usage, "model_dump") else {}
+            return self._build_output(raw_content, usage, model, start_time, response_time_ms)
+        
+        except Exception as e:
+            logger.error(f"Error processing prompt: {e}")
+            raise
+    
+    async def _aprocess_one(
+        self, input_data: ProcessingInput, semaphore: asyncio.Semaphore
+    ) -> Optional[ProcessingOutput]:
+        """Process a single prompt on the async client, bounded by a semaphore.
+        
+        Args:
+            input_data: Processing input with prompt and parameters
+            semaphore: Semaphore limiting the number of in-flight requests
+        
+        Returns:
+            Processing output with structured data and metrics, None if the request failed
+        """
+        request = self._build_request(input_data)
+        
+        try:
+            raw_response, start_time, response_time_ms = await self._acall_api(semaphore, **request)
+            raw_content, usage = self._read_completion(raw_response)
+            return self._build_output(raw_content, usage, request["model"], start_time, response_time_ms)
+        except Exception as e:
+            logger.error(f"Error processing prompt in batch: {e}")
+            return None
+    
+    async def aprocess_batch(
+        self,
+        inputs: List[ProcessingInput],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Optional[ProcessingOutput]]:
+        """Process several prompts concurrently using the async OpenAI client.
+        
+        Requests overlap on the network instead of running one after another,
+        with at most ``max_concurrency`` requests in flight at any time. A failed
+        request does not discard the results of the others.
+        
+        Args:
+            inputs: Processing inputs to send
+            max_concurrency: Maximum concurrent requests, uses settings if not provided
+        
+        Returns:
+            Processing outputs in the same order as the inputs, None for requests that failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrency)
+        
+        # Create the client up front, so a configuration error is raised once
+        # instead of being reported as a failure of every request
+        self.aclient
+        
+        logger.info(f"Processing batch of {len(inputs)} prompts")
+        
+        return list(await asyncio.gather(*(self._aprocess_one(i, semaphore) for i in inputs)))
+    
+    def process_batch(
+        self,
+        inputs: List[ProcessingInput],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Optional[ProcessingOutput]]:
+        """Synchronous entry point for :meth:`aprocess_batch`.
+        
+        Args:
+            inputs: Processing inputs to send
+            max_concurrency: Maximum concurrent requests, uses settings if not provided
+        
+        Returns:
+            Processing outputs in the same order as the inputs, None for requests that failed
+        """
+        return self._run_async(self.aprocess_batch(inputs, max_concurrency))
+    
+    def submit_batch(self, inputs: List[ProcessingInput]) -> str:
+        """Submit prompts as a job on the OpenAI Batch API.
+        
+        Batch jobs are billed at half the price of regular requests and use a
+        separate rate limit pool, at the cost of completing within 24 hours.
+        
+        Args:
+            inputs: Processing inputs to send
+        
+        Returns:
+            ID of the created batch
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._build_request(input_data),
+            })
+            for index, input_data in enumerate(inputs)
+        ]
+        
+        logger.info(f"Submitting batch of {len(inputs)} prompts")
+        
+        try:
+            input_file = self.client.files.create(
+                file=("batch_input.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+        except Exception as e:
+            logger.error(f"Error submitting batch: {e}")
+            raise
+        
+        logger.info(f"Created batch {batch.id}")
+        return batch.id
+    
+    @_retry_transient_errors
+    def _retrieve_batch(self, batch_id: str) -> Any:
+        """Get the current state of a batch, retrying transient API errors.
+        
+        Args:
+            batch_id: ID of the batch
+        
+        Returns:
+            Batch returned by the OpenAI client
+        """
+        return self.client.batches.retrieve(batch_id)
+    
+    @_retry_transient_errors
+    def _download_file(self, file_id: str) -> str:
+        """Download the text content of a file, retrying transient API errors.
+        
+        Args:
+            file_id: ID of the file
+        
+        Returns:
+            File content
+        """
+        return self.client.files.content(file_id).text
+    
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+    ) -> List[Optional[ProcessingOutput]]:
+        """Wait for a batch to finish and download its results.
+        
+        The batch status is polled with exponential backoff, starting at
+        ``poll_interval`` seconds and capped at ``max_poll_interval``. Transient
+        API errors while polling or downloading are retried, and a batch can be
+        waited for again by ID if the wait is interrupted.
+        
+        Args:
+            batch_id: ID returned by :meth:`submit_batch`
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Maximum delay between status checks in seconds
+        
+        Returns:
+            Processing outputs in submission order, None for requests that failed
+        
+        Raises:
+            RuntimeError: If the batch did not complete successfully
+        """
+        delay = poll_interval
+        batch = self._retrieve_batch(batch_id)
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            logger.debug("Batch {} is {}, checking again in {}s", batch_id, batch.status, delay)
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = self._retrieve_batch(batch_id)
+        
+        if batch.status != "completed":
+            logger.error(f"Batch {batch_id} ended with status {batch.status}")
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+        
+        start_time = datetime.fromtimestamp(batch.created_at)
+        end_ns = batch.completed_at * 1_000_000_000 if batch.completed_at else time.time_ns()
+        response_time_ms = calculate_response_time(batch.created_at * 1_000_000_000, end_ns)
+        
+        outputs: List[Optional[ProcessingOutput]] = [None] * batch.request_counts.total
+        
+        # Successful requests are written to the output file, which is not
+        # created at all when every request failed
+        if batch.output_file_id:
+            for record in self._read_batch_file(batch.output_file_id):
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    self._log_batch_error(record)
+                    continue
                 
-            # Create metrics
-            metrics = create_response_metrics(start_time, end_time, usage, model)
+                completion = ChatCompletion.model_validate(response["body"])
+                raw_content, usage = self._read_completion(completion)
+                outputs[int(record["custom_id"])] = self._build_output(
+                    raw_content, usage, completion.model, start_time, response_time_ms
+                )
+        else:
+            logger.warning(f"Batch {batch_id} produced no output file")
+        
+        # Failed requests are written to a separate error file
+        if batch.error_file_id:
+            for record in self._read_batch_file(batch.error_file_id):
+                self._log_batch_error(record)
+        
+        return outputs
+    
+    def _read_batch_file(self, file_id: str) -> Iterator[Dict[str, Any]]:
+        """Download a batch output or error file and parse its JSONL records.
+        
+        Args:
+            file_id: ID of the file
+        
+        Returns:
+            Iterator over the records of the file
+        """
+        for line in self._download_file(file_id).splitlines():
+            if line.strip():
+                yield orjson.loads(line)
+    
+    @staticmethod
+    def _log_batch_error(record: Dict[str, Any]) -> None:
+        """Log why a request in a batch failed.
+        
+        Args:
+            record: Record of the failed request from a batch output or error file
+        """
+        response = record.get("response") or {}
+        error = record.get("error") or (response.get("body") or {}).get("error")
+        logger.error(
+            f"Batch request {record['custom_id']} failed "
+            f"with status {response.get('status_code')}: {error}"
+        )
+    
+    async def _aprocess_samples(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        samples: List[str],
+        parameters: ModelParameters,
+        semaphore: asyncio.Semaphore,
+    ) -> List[EntityOutput]:
+        """Extract entities from several samples with a single request.
+        
+        ``parameters.max_tokens`` is a per-sample budget, so the request allows
+        that many tokens for every sample, up to ``MULTI_SAMPLE_MAX_TOKENS``. If
+        the response is still cut off, the samples are split in half and each
+        half is requested again, so truncation does not empty the whole chunk.
+        
+        Args:
+            system_prompt: System prompt for context setting
+            user_prompt: User prompt with specific instructions
+            samples: Sample texts to process together
+            parameters: Model parameters for the request
+            semaphore: Semaphore limiting the number of in-flight requests
+        
+        Returns:
+            Extracted entities, one per sample
+        """
+        max_tokens = min(parameters.max_tokens * len(samples), MULTI_SAMPLE_MAX_TOKENS)
+        raw_response, _, _ = await self._acall_api(
+            semaphore,
+            model=parameters.model,
+            messages=self._build_multi_messages(system_prompt, user_prompt, samples),
+            temperature=parameters.temperature,
+            max_tokens=max_tokens,
+        )
+        
+        choice = raw_response.choices[0]
+        if choice.finish_reason == "length":
+            if len(samples) > 1:
+                logger.warning(
+                    f"Response for {len(samples)} samples was truncated at {max_tokens} tokens, "
+                    "splitting them across two requests"
+                )
+                middle = len(samples) // 2
+                first, second = await asyncio.gather(
+                    self._aprocess_samples(system_prompt, user_prompt, samples[:middle], parameters, semaphore),
+                    self._aprocess_samples(system_prompt, user_prompt, samples[middle:], parameters, semaphore),
+                )
+                return first + second
             
-            return ProcessingOutput(
-                result=response,
-                metrics=metrics,
-                raw_response=response.model_dump() if hasattr(response, "model_dump") else None
+            logger.warning(f"Response for a single sample was truncated at {max_tokens} tokens")
+        
+        raw_content = choice.message.content
+        logger.debug("Raw response content: {}", raw_content)
+        
+        return self._parse_entity_list(raw_content, len(samples), self.strict)
+    
+    async def aprocess_prompts_multi(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        samples: List[str],
+        parameters: Optional[ModelParameters] = None,
+        batch_size: int = 20,
+        max_concurrency: Optional[int] = None,
+    ) -> List[EntityOutput]:
+        """Extract entities from many samples, packing several into each request.
+        
+        The system and user prompts are sent once per chunk of ``batch_size``
+        samples instead of once per sample, and the chunks are processed
+        concurrently.
+        
+        Args:
+            system_prompt: System prompt for context setting
+            user_prompt: User prompt with specific instructions
+            samples: Sample texts to extract entities from
+            parameters: Model parameters, uses defaults if not provided. Their
+                max_tokens is a per-sample budget
+            batch_size: Maximum number of samples sent in one request
+            max_concurrency: Maximum concurrent requests, uses settings if not provided
+        
+        Returns:
+            Extracted entities in the same order as the samples
+        
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        
+        parameters = parameters or ModelParameters()
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrency)
+        chunks = [samples[i:i + batch_size] for i in range(0, len(samples), batch_size)]
+        
+        logger.info(f"Processing {len(samples)} samples in {len(chunks)} requests")
+        
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._aprocess_samples(system_prompt, user_prompt, chunk, parameters, semaphore)
+                    for chunk in chunks
+                )
             )
-            
         except Exception as e:
-            logger.error(f"Error processing prompt: {e}")
+            logger.error(f"Error processing samples: {e}")
             raise
+        
+        return [entity for chunk_result in results for entity in chunk_result]
+    
+    def process_prompts_multi(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        samples: List[str],
+        parameters: Optional[ModelParameters] = None,
+        batch_size: int = 20,
+        max_concurrency: Optional[int] = None,
+    ) -> List[EntityOutput]:
+        """Synchronous entry point for :meth:`aprocess_prompts_multi`.
+        
+        Args:
+            system_prompt: System prompt for context setting
+            user_prompt: User prompt with specific instructions
+            samples: Sample texts to extract entities from
+            parameters: Model parameters, uses defaults if not provided
+            batch_size: Maximum number of samples sent in one request
+            max_concurrency: Maximum concurrent requests, uses settings if not provided
+        
+        Returns:
+            Extracted entities in the same order as the samples
+        """
+        return self._run_async(
+            self.aprocess_prompts_multi(
+                system_prompt, user_prompt, samples, parameters, batch_size, max_concurrency
+            )
+        )
@@ -10,7 +10,11 @@ from app.models.input import ModelParameters, ProcessingInput, PromptInput
 from app.models.output import TokenUsage, ResponseMetrics, EntityOutput, ProcessingOutput
 
 
-@pytest.fixture
+# Fixtures returning strings or models that tests only read are built once per
+# session; fixtures holding dicts tests may modify stay function scoped.
+
+
+@pytest.fixture(scope="session")
 def sample_system_prompt() -> str:
     """Sample system prompt for testing."""
     return (
@@ -20,7 +24,7 @@ def sample_system_prompt() -> str:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_user_prompt() -> str:
     """Sample user prompt for testing."""
     return (
@@ -29,13 +33,13 @@ def sample_user_prompt() -> str:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_text() -> str:
     """Sample medical text for testing."""
     return "Patient requires a full face CPAP mask with humidifier due to AHI > 20. Ordered by Dr. Cameron."
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_prompt_input(sample_system_prompt, sample_user_prompt, sample_text) -> PromptInput:
     """Sample prompt input model for testing."""
     return PromptInput(
@@ -45,7 +49,7 @@ def sample_prompt_input(sample_system_prompt, sample_user_prompt, sample_text) -
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_model_parameters() -> ModelParameters:
     """Sample model parameters for testing."""
     return ModelParameters(
@@ -55,7 +59,7 @@ def sample_model_parameters() -> ModelParameters:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_processing_input(sample_prompt_input, sample_model_parameters) -> ProcessingInput:
     """Sample processing input for testing."""
     return ProcessingInput(
@@ -64,7 +68,7 @@ def sample_processing_input(sample_prompt_input, sample_model_parameters) -> Pro
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_token_usage() -> TokenUsage:
     """Sample token usage for testing."""
     return TokenUsage(
@@ -74,22 +78,20 @@ def sample_token_usage() -> TokenUsage:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_response_metrics(sample_token_usage) -> ResponseMetrics:
     """Sample response metrics for testing."""
     start_time = datetime(2025, 6, 16, 10, 0, 0)
-    end_time = datetime(2025, 6, 16, 10, 0, 1)
     
     return ResponseMetrics(
         start_time=start_time,
-        end_time=end_time,
         response_time_ms=1000,
         token_usage=sample_token_usage,
         model="gpt-4o",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entity_output() -> EntityOutput:
     """Sample entity output for testing."""
     return EntityOutput(
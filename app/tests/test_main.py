@@ -0,0 +1,50 @@
+"""Tests for the CLI entry point."""
+
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from app.main import app
+
+
+class TestCli:
+    """Test cases for the CLI application."""
+    
+    def test_all_commands_registered(self):
+        """Test every command is available whatever the process arguments are."""
+        runner = CliRunner()
+        
+        for command in ("extract", "extract-batch"):
+            result = runner.invoke(app, ["--log-level", "ERROR", command, "--help"])
+            
+            assert result.exit_code == 0, result.output
+    
+    @patch("app.services.openai_service.OpenAIService")
+    def test_extract_batch_resumes_batch(self, mock_service):
+        """Test --batch-id waits for an existing batch instead of submitting a new one."""
+        mock_service.return_value.wait_for_batch.return_value = []
+        
+        result = CliRunner().invoke(app, ["extract-batch", "--api-key", "test_key", "--batch-id", "batch-123"])
+        
+        assert result.exit_code == 0, result.output
+        mock_service.return_value.submit_batch.assert_not_called()
+        mock_service.return_value.wait_for_batch.assert_called_once_with("batch-123")
+    
+    def test_extract_batch_requires_inputs(self):
+        """Test extract-batch fails without an inputs file or a batch ID."""
+        result = CliRunner().invoke(app, ["extract-batch", "--api-key", "test_key"])
+        
+        assert result.exit_code == 1
+        assert "--inputs-file" in result.output
+    
+    def test_extract_batch_empty_inputs(self, tmp_path):
+        """Test extract-batch fails when the inputs file has no inputs."""
+        inputs_file = tmp_path / "items.jsonl"
+        inputs_file.write_text("\n", encoding="utf-8")
+        
+        result = CliRunner().invoke(
+            app, ["extract-batch", "--api-key", "test_key", "--inputs-file", str(inputs_file)]
+        )
+        
+        assert result.exit_code == 1
+        assert "No inputs found" in result.output
@@ -1,5 +1,7 @@
 """Tests for Pydantic models."""
 
+from datetime import datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -22,16 +24,18 @@ class TestInputModels:
         assert prompt.user_prompt == sample_user_prompt
         assert prompt.sample_text == sample_text
     
-    def test_prompt_input_empty_validation(self):
+    @pytest.mark.parametrize(
+        "system_prompt, user_prompt, sample_text, field",
+        [
+            ("", "test", "test", "system_prompt"),
+            ("test", "", "test", "user_prompt"),
+            ("test", "test", "", "sample_text"),
+        ],
+    )
+    def test_prompt_input_empty_validation(self, system_prompt, user_prompt, sample_text, field):
         """Test validation error for empty prompt inputs."""
-        with pytest.raises(ValidationError):
-            PromptInput(system_prompt="", user_prompt="test", sample_text="test")
-            
-        with pytest.raises(ValidationError):
-            PromptInput(system_prompt="test", user_prompt="", sample_text="test")
-            
-        with pytest.raises(ValidationError):
-            PromptInput(system_prompt="test", user_prompt="test", sample_text="")
+        with pytest.raises(ValidationError, match=field):
+            PromptInput(system_prompt=system_prompt, user_prompt=user_prompt, sample_text=sample_text)
     
     def test_model_parameters_defaults(self):
         """Test model parameters default values."""
@@ -53,18 +57,21 @@ class TestInputModels:
         assert params.temperature == 0.7
         assert params.max_tokens == 500
     
-    def test_model_parameters_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            # Temperature must be between 0 and 1
+            {"temperature": -0.1},
+            {"temperature": 1.1},
+            # Max tokens must be greater than 0
+            {"max_tokens": 0},
+        ],
+    )
+    def test_model_parameters_validation(self, kwargs):
         """Test validation rules for model parameters."""
-        # Temperature must be between 0 and 1
-        with pytest.raises(ValidationError):
-            ModelParameters(temperature=-0.1)
-            
-        with pytest.raises(ValidationError):
-            ModelParameters(temperature=1.1)
-            
-        # Max tokens must be greater than 0
-        with pytest.raises(ValidationError):
-            ModelParameters(max_tokens=0)
+        (field,) = kwargs
+        with pytest.raises(ValidationError, match=field):
+            ModelParameters(**kwargs)
     
     def test_processing_input(self, sample_prompt_input, sample_model_parameters):
         """Test processing input model."""
@@ -120,13 +127,14 @@ class TestOutputModels:
         """Test response metrics model."""
         metrics = ResponseMetrics(
             start_time="2023-01-01T10:00:00",
-            end_time="2023-01-01T10:00:01",
             response_time_ms=1000,
             token_usage=sample_token_usage,
             model="gpt-4o",
         )
         
         assert metrics.response_time_ms == 1000
+        assert metrics.end_time == datetime(2023, 1, 1, 10, 0, 1)
+        assert metrics.model_dump()["end_time"] == metrics.end_time
         assert metrics.token_usage == sample_token_usage
         assert metrics.model == "gpt-4o"
     
@@ -1,26 +1,114 @@
 """Tests for OpenAI service."""
 
+import asyncio
+import json
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from openai import APIConnectionError
+from tenacity import wait_fixed, wait_none
 
+from app.models.input import ModelParameters, ProcessingInput
 from app.models.output import ProcessingOutput
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import OpenAIService, _shared_http_client
+
+
+# Entities encoded in the mock_openai_response fixture's message content
+_ENTITY_DICT = {
+    "device": "CPAP",
+    "mask_type": "full face",
+    "add_ons": ["humidifier"],
+    "qualifier": "AHI > 20",
+    "ordering_provider": "Dr. Cameron",
+}
+
+
+class _FakeCompletions:
+    """Stand-in for client.chat.completions that returns or raises a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        result = self.result.pop(0) if isinstance(self.result, list) else self.result
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class _FakeClient:
+    """Duck-typed OpenAI client exposing only chat.completions."""
+
+    def __init__(self, result):
+        self.completions = _FakeCompletions(result)
+        self.chat = self
+
+
+def _make_usage(usage):
+    """Build a usage object whose model_dump returns the given token counts."""
+    return SimpleNamespace(model_dump=lambda: usage)
+
+
+def _make_stream(content, usage=None, chunk_size=16):
+    """Build streamed chat completion chunks for the given message content."""
+    chunks = [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + chunk_size]))],
+            usage=None,
+        )
+        for i in range(0, len(content), chunk_size)
+    ]
+    usage_chunk = SimpleNamespace(choices=[], usage=_make_usage(usage) if usage is not None else None)
+    return iter(chunks + [usage_chunk])
+
+
+def _make_completion(content, usage=None, finish_reason="stop"):
+    """Build a chat completion with the given message content and token usage."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)],
+        usage=_make_usage(usage) if usage is not None else None,
+    )
+
+
+def _make_batch(total, output_file_id="file-out", error_file_id=None):
+    """Build a completed batch with the given request count and result files."""
+    return SimpleNamespace(
+        status="completed",
+        output_file_id=output_file_id,
+        error_file_id=error_file_id,
+        created_at=1677858242,
+        completed_at=1677858302,
+        request_counts=SimpleNamespace(total=total),
+    )
+
+
+def _jsonl(records):
+    """Serialize records as the text of a JSONL file."""
+    return "\n".join(json.dumps(record) for record in records)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_openai():
+    """Patch the OpenAI client class once for every test in this module."""
+    with patch("app.services.openai_service.OpenAI") as mock:
+        yield mock
 
 
 class TestOpenAIService:
     """Test cases for OpenAI service."""
 
-    @patch("app.services.openai_service.OpenAI")
     def test_init_with_api_key(self, mock_openai):
         """Test service initialization with API key."""
         service = OpenAIService(api_key="test_key")
 
         assert service.api_key == "test_key"
-        mock_openai.assert_called_once_with(api_key="test_key")
+        mock_openai.assert_called_once_with(api_key="test_key", http_client=_shared_http_client())
 
-    @patch("app.services.openai_service.OpenAI")
     @patch("app.services.openai_service.settings")
     def test_init_with_settings(self, mock_settings, mock_openai):
         """Test service initialization with settings API key."""
@@ -29,11 +117,18 @@ class TestOpenAIService:
         service = OpenAIService()
 
         assert service.api_key == "settings_key"
-        mock_openai.assert_called_once_with(api_key="settings_key")
+        mock_openai.assert_called_once_with(api_key="settings_key", http_client=_shared_http_client())
+
+    def test_http_client_shared(self, mock_openai):
+        """Test services reuse one HTTP client instead of opening new connection pools."""
+        OpenAIService(api_key="first_key")
+        OpenAIService(api_key="second_key")
+
+        first, second = mock_openai.call_args_list
+        assert first.kwargs["http_client"] is second.kwargs["http_client"]
 
-    @patch("app.services.openai_service.OpenAI")
     @patch("app.services.openai_service.settings")
-    def test_create_client_without_api_key(self, mock_settings, mock_openai):
+    def test_create_client_without_api_key(self, mock_settings):
         """Test client creation fails without API key."""
         # Ensure settings.openai_api_key returns None
         mock_settings.openai_api_key = None
@@ -41,28 +136,478 @@ class TestOpenAIService:
         with pytest.raises(ValueError, match="OpenAI API key is required"):
             OpenAIService(api_key="")
 
-    @patch("app.services.openai_service.instructor.patch")
+    @patch("instructor.patch")
     def test_client_patched_with_instructor(self, mock_patch, mock_openai_client):
-        """Test that client is patched with instructor."""
+        """Test that client is patched with instructor on first access only."""
         mock_patch.return_value = "patched_client"
 
         service = OpenAIService(api_key="test_key")
 
-        mock_patch.assert_called_once()
+        mock_patch.assert_not_called()
+        assert service.client_with_schema == "patched_client"
         assert service.client_with_schema == "patched_client"
+        mock_patch.assert_called_once_with(mock_openai_client)
+
+    def test_process_prompt_success(
+        self, mock_openai_client, sample_processing_input, mock_openai_response
+    ):
+        """Test a prompt is sent once and the response parsed into entities."""
+        mock_openai_client.chat.completions.create.return_value = _make_stream(
+            mock_openai_response["choices"][0]["message"]["content"], mock_openai_response["usage"]
+        )
+
+        service = OpenAIService(api_key="test_key")
+        output = service.process_prompt(sample_processing_input)
+
+        mock_openai_client.chat.completions.create.assert_called_once()
+        kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+        assert isinstance(output, ProcessingOutput)
+        assert output.result.device == "CPAP"
+        assert output.result.ordering_provider == "Dr. Cameron"
+        assert output.metrics.token_usage.total_tokens == 150
+        assert output.metrics.model == "gpt-4o"
+        assert output.raw_response == _ENTITY_DICT
+
+    def test_process_prompt_invalid_json(self, mock_openai_client, sample_processing_input):
+        """Test an unparseable response yields an empty entity output."""
+        mock_openai_client.chat.completions.create.return_value = _make_stream("no entities found")
+
+        service = OpenAIService(api_key="test_key")
+        output = service.process_prompt(sample_processing_input)
+
+        assert output.result.model_dump() == {}
+        assert output.raw_response == {}
+
+    def test_process_prompt_with_injected_client(self, sample_processing_input, mock_openai_response):
+        """Test an injected client is used as is, without an API key."""
+        client = _FakeClient(
+            _make_stream(mock_openai_response["choices"][0]["message"]["content"])
+        )
+
+        service = OpenAIService(client=client)
+        output = service.process_prompt(sample_processing_input)
+
+        assert service.client is client
+        assert output.result.device == "CPAP"
+        assert client.completions.calls[0]["model"] == "gpt-4o"
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_process_batch_with_injected_aclient(
+        self, mock_async_openai, sample_processing_input, mock_openai_response
+    ):
+        """Test an injected async client is used for batches and left open."""
+        aclient = MagicMock()
+        aclient.chat.completions.create = AsyncMock(
+            return_value=_make_completion(
+                mock_openai_response["choices"][0]["message"]["content"], mock_openai_response["usage"]
+            )
+        )
+        aclient.close = AsyncMock()
+
+        service = OpenAIService(client=_FakeClient(None), aclient=aclient)
+        outputs = service.process_batch([sample_processing_input])
+
+        assert outputs[0].result.device == "CPAP"
+        mock_async_openai.assert_not_called()
+        aclient.close.assert_not_awaited()
+
+    @patch("app.services.openai_service.settings")
+    def test_process_batch_without_aclient_or_api_key(self, mock_settings, sample_processing_input):
+        """Test the async path fails clearly when only a sync client was injected."""
+        mock_settings.openai_api_key = ""
+        mock_settings.max_concurrency = 10
+
+        service = OpenAIService(client=_FakeClient(None))
+
+        with pytest.raises(ValueError, match="aclient"):
+            service.process_batch([sample_processing_input])
+
+    def test_process_prompt_error_handling(self, sample_processing_input):
+        """Test API errors are propagated to the caller."""
+        service = OpenAIService(client=_FakeClient(RuntimeError("API unavailable")))
+
+        with pytest.raises(RuntimeError, match="API unavailable"):
+            service.process_prompt(sample_processing_input)
+        assert len(service.client.completions.calls) == 1
+
+    @patch.object(OpenAIService._stream_api.retry, "wait", wait_none())
+    def test_process_prompt_retries_transient_errors(
+        self, sample_processing_input, mock_openai_response
+    ):
+        """Test connection errors are retried until the request succeeds."""
+        error = APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+        client = _FakeClient(
+            [error, error, _make_stream(mock_openai_response["choices"][0]["message"]["content"])]
+        )
+
+        service = OpenAIService(client=client)
+        output = service.process_prompt(sample_processing_input)
+
+        assert len(client.completions.calls) == 3
+        assert output.result.device == "CPAP"
+
+    @patch.object(OpenAIService._stream_api.retry, "wait", wait_none())
+    def test_process_prompt_retries_errors_while_streaming(
+        self, sample_processing_input, mock_openai_response
+    ):
+        """Test a connection dropped while reading the stream retries the whole request."""
+        def interrupted_stream():
+            yield from _make_stream('{"device": ')
+            raise httpx.ReadTimeout("timed out", request=httpx.Request("POST", "https://api.openai.com"))
+
+        client = _FakeClient(
+            [
+                interrupted_stream(),
+                _make_stream(mock_openai_response["choices"][0]["message"]["content"]),
+            ]
+        )
+
+        service = OpenAIService(client=client)
+        output = service.process_prompt(sample_processing_input)
+
+        assert len(client.completions.calls) == 2
+        assert output.result.device == "CPAP"
+
+    @patch.object(OpenAIService._stream_api.retry, "wait", wait_none())
+    def test_process_prompt_gives_up_after_retries(self, sample_processing_input):
+        """Test the original error is raised once all attempts fail."""
+        error = APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+        client = _FakeClient(error)
+
+        service = OpenAIService(client=client)
+
+        with pytest.raises(APIConnectionError):
+            service.process_prompt(sample_processing_input)
+        assert len(client.completions.calls) == 3
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_aprocess_batch_preserves_order(
+        self, mock_async_openai, mock_openai_client, sample_prompt_input, mock_openai_response
+    ):
+        """Test batch outputs are returned in input order."""
+        async def create(**kwargs):
+            sample = kwargs["messages"][1]["content"].rsplit("Input Text: ", 1)[1]
+            return _make_completion(json.dumps({"sample": sample}), mock_openai_response["usage"])
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value.close = AsyncMock()
+        inputs = [
+            ProcessingInput(prompt=sample_prompt_input.model_copy(update={"sample_text": f"text {i}"}))
+            for i in range(5)
+        ]
+
+        service = OpenAIService(api_key="test_key")
+        outputs = service.process_batch(inputs)
+
+        assert [o.result.sample for o in outputs] == [f"text {i}" for i in range(5)]
+        mock_async_openai.assert_called_once_with(api_key="test_key", http_client=ANY)
+        mock_async_openai.return_value.close.assert_awaited_once()
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_aprocess_batch_bounded_concurrency(
+        self, mock_async_openai, mock_openai_client, sample_processing_input, mock_openai_response
+    ):
+        """Test no more than max_concurrency requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _make_completion(
+                mock_openai_response["choices"][0]["message"]["content"], mock_openai_response["usage"]
+            )
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+
+        service = OpenAIService(api_key="test_key")
+        outputs = asyncio.run(
+            service.aprocess_batch([sample_processing_input] * 6, max_concurrency=2)
+        )
+
+        assert len(outputs) == 6
+        assert peak == 2
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_aprocess_batch_keeps_results_when_a_request_fails(
+        self, mock_async_openai, mock_openai_client, sample_prompt_input, mock_openai_response
+    ):
+        """Test a failed request yields None without discarding the other results."""
+        async def create(**kwargs):
+            if kwargs["messages"][1]["content"].endswith("Input Text: bad"):
+                raise ValueError("content filtered")
+            return _make_completion(
+                mock_openai_response["choices"][0]["message"]["content"], mock_openai_response["usage"]
+            )
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value.close = AsyncMock()
+        inputs = [
+            ProcessingInput(prompt=sample_prompt_input.model_copy(update={"sample_text": text}))
+            for text in ("good", "bad", "good")
+        ]
+
+        service = OpenAIService(api_key="test_key")
+        outputs = service.process_batch(inputs)
+
+        assert outputs[0].result.device == "CPAP"
+        assert outputs[1] is None
+        assert outputs[2].result.device == "CPAP"
+
+    @patch.object(OpenAIService._acall_api.retry, "wait", wait_fixed(0.05))
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_aprocess_batch_releases_slot_while_backing_off(
+        self, mock_async_openai, mock_openai_client, sample_prompt_input, mock_openai_response
+    ):
+        """Test a request backing off before a retry does not hold its concurrency slot."""
+        calls = []
+        error = APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+
+        async def create(**kwargs):
+            sample = kwargs["messages"][1]["content"].rsplit("Input Text: ", 1)[1]
+            calls.append(sample)
+            if calls == ["first"]:
+                raise error
+            return _make_completion(
+                mock_openai_response["choices"][0]["message"]["content"], mock_openai_response["usage"]
+            )
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_openai.return_value.close = AsyncMock()
+        inputs = [
+            ProcessingInput(prompt=sample_prompt_input.model_copy(update={"sample_text": text}))
+            for text in ("first", "second")
+        ]
+
+        service = OpenAIService(api_key="test_key")
+        outputs = service.process_batch(inputs, max_concurrency=1)
+
+        assert calls == ["first", "second", "first"]
+        assert all(output is not None for output in outputs)
+
+    def test_submit_batch(self, mock_openai_client, sample_processing_input):
+        """Test inputs are uploaded as a JSONL file and a batch is created."""
+        mock_openai_client.files.create.return_value.id = "file-123"
+        mock_openai_client.batches.create.return_value.id = "batch-123"
+
+        service = OpenAIService(api_key="test_key")
+        batch_id = service.submit_batch([sample_processing_input] * 2)
+
+        assert batch_id == "batch-123"
+        _, content = mock_openai_client.files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in content.decode("utf-8").splitlines()]
+        assert [line["custom_id"] for line in lines] == ["0", "1"]
+        assert all(line["url"] == "/v1/chat/completions" for line in lines)
+        assert lines[0]["body"]["model"] == "gpt-4o"
+        mock_openai_client.batches.create.assert_called_once_with(
+            input_file_id="file-123",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+    @patch("app.services.openai_service.time.sleep")
+    def test_wait_for_batch(self, mock_sleep, mock_openai_client, mock_openai_response):
+        """Test polling backs off until completion and results are returned in order."""
+        pending = SimpleNamespace(status="in_progress")
+        completed = _make_batch(3, error_file_id="file-err")
+        mock_openai_client.batches.retrieve.side_effect = [pending, pending, completed]
+        files = {
+            "file-out": _jsonl([
+                {"custom_id": "1", "response": {"status_code": 200, "body": mock_openai_response}},
+                {"custom_id": "0", "response": {"status_code": 200, "body": mock_openai_response}},
+            ]),
+            "file-err": _jsonl([
+                {
+                    "custom_id": "2",
+                    "response": {"status_code": 400, "body": {"error": {"message": "bad request"}}},
+                    "error": None,
+                },
+            ]),
+        }
+        mock_openai_client.files.content.side_effect = lambda file_id: SimpleNamespace(text=files[file_id])
+
+        service = OpenAIService(api_key="test_key")
+        with patch("app.services.openai_service.logger") as mock_logger:
+            outputs = service.wait_for_batch("batch-123", poll_interval=1.0)
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+        assert outputs[0].result.device == "CPAP"
+        assert outputs[1].metrics.token_usage.total_tokens == 150
+        assert outputs[1].metrics.response_time_ms == 60000
+        assert outputs[2] is None
+        assert "bad request" in mock_logger.error.call_args.args[0]
+
+    def test_wait_for_batch_all_requests_failed(self, mock_openai_client):
+        """Test a completed batch without an output file returns None for every request."""
+        mock_openai_client.batches.retrieve.return_value = _make_batch(
+            2, output_file_id=None, error_file_id="file-err"
+        )
+        mock_openai_client.files.content.return_value.text = _jsonl([
+            {"custom_id": "0", "response": None, "error": {"message": "failed"}},
+            {"custom_id": "1", "response": None, "error": {"message": "failed"}},
+        ])
+
+        service = OpenAIService(api_key="test_key")
+        outputs = service.wait_for_batch("batch-123")
+
+        assert outputs == [None, None]
+        mock_openai_client.files.content.assert_called_once_with("file-err")
+
+    @patch.object(OpenAIService._retrieve_batch.retry, "wait", wait_none())
+    def test_wait_for_batch_retries_transient_errors(self, mock_openai_client):
+        """Test a transient error while polling does not abort the wait."""
+        error = APIConnectionError(request=httpx.Request("GET", "https://api.openai.com"))
+        mock_openai_client.batches.retrieve.side_effect = [error, _make_batch(1)]
+        mock_openai_client.files.content.return_value.text = ""
+
+        service = OpenAIService(api_key="test_key")
+        outputs = service.wait_for_batch("batch-123")
+
+        assert mock_openai_client.batches.retrieve.call_count == 2
+        assert outputs == [None]
+
+    def test_wait_for_batch_failed(self, mock_openai_client):
+        """Test an unsuccessful batch raises an error."""
+        mock_openai_client.batches.retrieve.return_value = SimpleNamespace(status="expired")
+
+        service = OpenAIService(api_key="test_key")
+
+        with pytest.raises(RuntimeError, match="expired"):
+            service.wait_for_batch("batch-123")
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_process_prompts_multi(
+        self, mock_async_openai, mock_openai_client, sample_system_prompt, sample_user_prompt
+    ):
+        """Test samples are chunked, numbered and fanned back out in order."""
+        async def create(**kwargs):
+            content = kwargs["messages"][1]["content"]
+            texts = content.split("Input Texts:\n", 1)[1].split("\n\n")
+            entities = [{"sample": text.split("] ", 1)[1]} for text in texts]
+            return _make_completion(f"```json\n{json.dumps(entities)}\n```")
+
+        create_mock = AsyncMock(side_effect=create)
+        mock_async_openai.return_value.chat.completions.create = create_mock
+        mock_async_openai.return_value.close = AsyncMock()
+        samples = [f"text {i}" for i in range(5)]
+
+        service = OpenAIService(api_key="test_key")
+        entities = service.process_prompts_multi(
+            sample_system_prompt, sample_user_prompt, samples, batch_size=2
+        )
+
+        assert create_mock.await_count == 3
+        assert [e.sample for e in entities] == samples
+        assert create_mock.await_args.kwargs["messages"][0]["content"] == sample_system_prompt
+
+    @patch("app.services.openai_service.AsyncOpenAI")
+    def test_process_prompts_multi_splits_truncated_chunk(
+        self, mock_async_openai, mock_openai_client, sample_system_prompt, sample_user_prompt
+    ):
+        """Test a chunk whose response is cut off is split and requested again."""
+        async def create(**kwargs):
+            content = kwargs["messages"][1]["content"]
+            texts = content.split("Input Texts:\n", 1)[1].split("\n\n")
+            entities = json.dumps([{"sample": text.split("] ", 1)[1]} for text in texts])
+            if len(texts) == 4:
+                # Cut off after three complete objects
+                return _make_completion(entities[:entities.index("text 3") - 13], finish_reason="length")
+            return _make_completion(entities)
+
+        create_mock = AsyncMock(side_effect=create)
+        mock_async_openai.return_value.chat.completions.create = create_mock
+        mock_async_openai.return_value.close = AsyncMock()
+        samples = [f"text {i}" for i in range(4)]
+
+        service = OpenAIService(api_key="test_key")
+        entities = service.process_prompts_multi(
+            sample_system_prompt, sample_user_prompt, samples, ModelParameters(max_tokens=100)
+        )
+
+        assert [e.sample for e in entities] == samples
+        assert [call.kwargs["max_tokens"] for call in create_mock.await_args_list] == [400, 200, 200]
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_process_prompts_multi_invalid_batch_size(self, mock_openai_client, batch_size):
+        """Test a batch size below one is rejected."""
+        service = OpenAIService(api_key="test_key")
+
+        with pytest.raises(ValueError, match="batch_size"):
+            service.process_prompts_multi("system", "user", ["text"], batch_size=batch_size)
+
+    def test_build_messages_reuses_system_message(self, sample_prompt_input):
+        """Test prompts sharing a system prompt reuse one system message."""
+        other = sample_prompt_input.model_copy(update={"sample_text": "Another note."})
+
+        first = OpenAIService._build_messages(sample_prompt_input)
+        second = OpenAIService._build_messages(other)
+
+        assert first[0] is second[0]
+        assert first[0] == {"role": "system", "content": sample_prompt_input.system_prompt}
+        assert second[1]["content"] == f"{sample_prompt_input.user_prompt}\n\nInput Text: Another note."
+
+    @pytest.mark.parametrize(
+        "raw_content",
+        [
+            '{"device": "CPAP", "provider": {"name": "Dr. Cameron"}}',
+            'Here you go:\n```json\n{"device": "CPAP", "provider": {"name": "Dr. Cameron"}}\n```',
+            'Result: {"device": "CPAP", "provider": {"name": "Dr. Cameron"}} Done {}',
+        ],
+    )
+    def test_parse_entities_nested_json(self, raw_content):
+        """Test nested objects are extracted whole, with or without surrounding text."""
+        entity, entity_data = OpenAIService._parse_entities(raw_content)
+
+        assert entity.device == "CPAP"
+        assert entity.provider == {"name": "Dr. Cameron"}
+        assert entity_data == entity.model_dump()
+
+    def test_parse_entities_braces_in_strings(self):
+        """Test braces and escaped quotes inside strings do not end the object."""
+        entity, _ = OpenAIService._parse_entities('{"qualifier": "AHI } 20 \\"{\\"", "device": "CPAP"}')
+
+        assert entity.qualifier == 'AHI } 20 "{"'
+        assert entity.device == "CPAP"
+
+    def test_parse_entities_strict_matches_construct(self):
+        """Test the unvalidated fast path builds the same model as strict validation."""
+        raw_content = '{"device": "CPAP", "add_ons": ["humidifier"]}'
+
+        assert OpenAIService._parse_entities(raw_content) == OpenAIService._parse_entities(
+            raw_content, strict=True
+        )
+
+    def test_parse_entity_list_wrong_length(self):
+        """Test a short or malformed array is padded to the number of samples."""
+        entities = OpenAIService._parse_entity_list('[{"device": "CPAP"}, "oops"]', 3)
+
+        assert len(entities) == 3
+        assert entities[0].device == "CPAP"
+        assert entities[1].model_dump() == {}
+        assert entities[2].model_dump() == {}
+
+    @pytest.fixture
+    def mock_openai(self, _patch_openai):
+        """Fixture for the patched OpenAI class, reset for each test."""
+        _patch_openai.reset_mock(return_value=True, side_effect=True)
+        return _patch_openai
 
     @pytest.fixture
-    def mock_openai_client(self):
+    def mock_openai_client(self, mock_openai):
         """Fixture for mocked OpenAI client."""
-        with patch("app.services.openai_service.OpenAI") as mock:
-            client = MagicMock()
-            mock.return_value = client
-            yield client
+        client = MagicMock()
+        mock_openai.return_value = client
+        return client
 
     @pytest.fixture
     def mock_patched_client(self):
         """Fixture for mocked instructor-patched client."""
-        with patch("app.services.openai_service.instructor.patch") as mock_patch:
+        with patch("instructor.patch") as mock_patch:
             patched_client = MagicMock()
             mock_patch.return_value = patched_client
             yield patched_client
@@ -2,11 +2,14 @@
 
 from datetime import datetime, timedelta
 import json
+import os
+import threading
 from unittest.mock import patch, MagicMock
 
 import pytest
 from rich.console import Console
 
+from app.utils import logging as logging_utils
 from app.utils.cli import display_results, format_metrics, read_file_contents
 from app.utils.metrics import calculate_response_time, create_response_metrics
 
@@ -16,11 +19,11 @@ class TestMetricsUtils:
     
     def test_calculate_response_time(self):
         """Test response time calculation."""
-        start_time = datetime(2025, 6, 16, 10, 0, 0)
-        end_time = datetime(2025, 6, 16, 10, 0, 1)
+        start_ns = 5_000_000_000
+        end_ns = 6_000_999_999
         
-        # Should be 1000ms (1 second difference)
-        result = calculate_response_time(start_time, end_time)
+        # Should be 1000ms (1 second difference, sub-millisecond remainder dropped)
+        result = calculate_response_time(start_ns, end_ns)
         
         assert result == 1000
         assert isinstance(result, int)
@@ -38,7 +41,7 @@ class TestMetricsUtils:
         
         model = "gpt-4o"
         
-        metrics = create_response_metrics(start_time, end_time, usage, model)
+        metrics = create_response_metrics(start_time, 1000, usage, model)
         
         assert metrics.start_time == start_time
         assert metrics.end_time == end_time
@@ -47,6 +50,14 @@ class TestMetricsUtils:
         assert metrics.token_usage.completion_tokens == 50
         assert metrics.token_usage.total_tokens == 150
         assert metrics.model == model
+    
+    def test_create_response_metrics_missing_usage(self):
+        """Test missing token counts default to zero."""
+        metrics = create_response_metrics(datetime(2025, 6, 16, 10, 0, 0), 1000, {}, "gpt-4o")
+        
+        assert metrics.token_usage.prompt_tokens == 0
+        assert metrics.token_usage.completion_tokens == 0
+        assert metrics.token_usage.total_tokens == 0
 
 
 class TestCliUtils:
@@ -65,7 +76,7 @@ class TestCliUtils:
         assert "Completion tokens: 50" in formatted
         assert "Total tokens: 150" in formatted
     
-    @patch("app.utils.cli.console")
+    @patch("app.utils.cli._console")
     def test_display_results(self, mock_console, sample_processing_output):
         """Test results display formatting."""
         display_results(sample_processing_output)
@@ -93,7 +104,71 @@ class TestCliUtils:
         
         assert content == test_content
     
+    def test_read_file_contents_reloads_modified_file(self, tmp_path):
+        """Test cached contents are refreshed when the file changes."""
+        test_file = tmp_path / "prompt.txt"
+        test_file.write_text("first", encoding="utf-8")
+        os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+        
+        assert read_file_contents(test_file) == "first"
+        
+        test_file.write_text("second", encoding="utf-8")
+        os.utime(test_file, ns=(2_000_000_000, 2_000_000_000))
+        
+        assert read_file_contents(test_file) == "second"
+    
+    def test_read_file_contents_decodes_utf8_and_newlines(self, tmp_path):
+        """Test files are decoded as UTF-8 with universal newlines."""
+        test_file = tmp_path / "sample.txt"
+        test_file.write_bytes("Patient née Müller\r\nAHI > 20\r".encode("utf-8"))
+        
+        assert read_file_contents(test_file) == "Patient née Müller\nAHI > 20\n"
+    
+    def test_read_file_contents_reads_past_reported_size(self, tmp_path):
+        """Test regular files reporting a size of zero, like procfs files, are read to EOF."""
+        test_file = tmp_path / "status"
+        test_file.write_text("Name:\tpython\n" * 10_000, encoding="utf-8")
+        real_stat = os.stat_result(os.stat(test_file))
+        fake_stat = os.stat_result(real_stat[:6] + (0,) + real_stat[7:])
+        
+        with patch("app.utils.cli.Path.stat", return_value=fake_stat):
+            assert read_file_contents(test_file) == "Name:\tpython\n" * 10_000
+    
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs are not supported")
+    def test_read_file_contents_fifo(self, tmp_path):
+        """Test pipes, which report a size of zero, are read to EOF and not cached."""
+        fifo = tmp_path / "input.fifo"
+        os.mkfifo(fifo)
+        
+        def write(text):
+            with open(fifo, "w", encoding="utf-8") as f:
+                f.write(text)
+        
+        for text in ("hello\n", "again\n"):
+            writer = threading.Thread(target=write, args=(text,))
+            writer.start()
+            assert read_file_contents(fifo) == text
+            writer.join()
+    
     def test_read_file_contents_error(self):
         """Test error handling when reading non-existent file."""
         with pytest.raises(Exception):
             read_file_contents("non_existent_file.txt")
+
+
+class TestLoggingUtils:
+    """Test cases for logging utilities."""
+    
+    @patch("app.utils.logging.logger")
+    def test_setup_logger_is_idempotent(self, mock_logger):
+        """Test handlers are only replaced when the level changes."""
+        with patch.object(logging_utils, "_active_level", None):
+            logging_utils.setup_logger("INFO")
+            logging_utils.setup_logger("INFO")
+            
+            assert mock_logger.add.call_count == 1
+            
+            logging_utils.setup_logger("DEBUG")
+            
+            assert mock_logger.add.call_count == 2
+            mock_logger.enable.assert_called_with("app")
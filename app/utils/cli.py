@@ -1,23 +1,51 @@
 """CLI helper utilities for the prompt wrangler."""
 
-import json
+import os
+import stat
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
-import typer
 from loguru import logger
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 
 from app.models.output import ProcessingOutput, ResponseMetrics
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+
+# Rich pulls in a large number of modules, so it is only imported once output is printed
+_console: Optional["Console"] = None
+
+_METRICS_TEMPLATE = (
+    "[bold]Response Time:[/bold] {response_time_ms} ms\n"
+    "[bold]Model:[/bold] {model}\n"
+    "[bold]Token Usage:[/bold]\n"
+    "  • Prompt tokens: {prompt_tokens}\n"
+    "  • Completion tokens: {completion_tokens}\n"
+    "  • Total tokens: {total_tokens}"
+)
+
+
+def get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use.
+    
+    Returns:
+        Console used for all CLI output
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        
+        _console = Console()
+    return _console
 
 
 def print_welcome_message() -> None:
     """Display welcome message for the prompt wrangler CLI."""
-    console.print(
+    from rich.panel import Panel
+    
+    get_console().print(
         Panel.fit(
             "[bold]🤖 Welcome to Prompt Wrangler[/bold]\n"
             "[italic]A tool for NER keyword extraction from medical texts[/italic]",
@@ -32,7 +60,7 @@ def print_error(message: str) -> None:
     Args:
         message: Error message to display
     """
-    console.print(f"[bold red]Error:[/bold red] {message}")
+    get_console().print(f"[bold red]Error:[/bold red] {message}")
 
 
 def format_metrics(metrics: ResponseMetrics) -> str:
@@ -46,14 +74,13 @@ def format_metrics(metrics: ResponseMetrics) -> str:
     """
     token_usage = metrics.token_usage
     
-    return (
-        f"[bold]Response Time:[/bold] {metrics.response_time_ms} ms\n"
-        f"[bold]Model:[/bold] {metrics.model}\n"
-        f"[bold]Token Usage:[/bold]\n"
-        f"  • Prompt tokens: {token_usage.prompt_tokens}\n"
-        f"  • Completion tokens: {token_usage.completion_tokens}\n"
-        f"  • Total tokens: {token_usage.total_tokens}"
-    )
+    return _METRICS_TEMPLATE.format_map({
+        "response_time_ms": metrics.response_time_ms,
+        "model": metrics.model,
+        "prompt_tokens": token_usage.prompt_tokens,
+        "completion_tokens": token_usage.completion_tokens,
+        "total_tokens": token_usage.total_tokens,
+    })
 
 
 def display_results(output: ProcessingOutput) -> None:
@@ -62,21 +89,77 @@ def display_results(output: ProcessingOutput) -> None:
     Args:
         output: Processing output to display
     """
+    console = get_console()
+    
     # Display extracted entities
     console.print("\n[bold green]📋 Extracted Entities:[/bold green]")
-    json_str = json.dumps(output.result.model_dump(), indent=2)
-    console.print(Syntax(json_str, "json", theme="monokai"))
+    console.print_json(output.result.model_dump_json(), indent=2)
     
     # Display metrics
     console.print("\n[bold blue]📊 Request Metrics:[/bold blue]")
-    metrics_table = Table(show_header=False, box=None)
-    metrics_table.add_row(format_metrics(output.metrics))
-    console.print(metrics_table)
+    console.print(format_metrics(output.metrics))
+
+
+# Read size used once the size reported by stat has been read, or when it is zero
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _read_file(path: Path, size_hint: int) -> str:
+    """Read a file to EOF straight from its file descriptor.
+    
+    The raw file descriptor is read directly and decoded once instead of going
+    through a buffered text reader. The size reported by ``stat`` is only used
+    for the first read, since procfs files report 0, sysfs files report 4096
+    and files may grow after they were stat'ed.
+    
+    Args:
+        path: Path to the file
+        size_hint: Size reported by ``stat``, in bytes
+        
+    Returns:
+        File contents as string
+    """
+    chunks = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        read_size = size_hint or _READ_CHUNK_SIZE
+        while True:
+            chunk = os.read(fd, read_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            read_size = _READ_CHUNK_SIZE
+    finally:
+        os.close(fd)
+    
+    text = b"".join(chunks).decode("utf-8")
+    # Match the universal newline handling of text mode reads
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
-def read_file_contents(file_path: str) -> str:
+@lru_cache(maxsize=32)
+def _read_cached(path: Path, mtime_ns: int, size: int) -> str:
+    """Read a file, caching its contents by path, modification time and size.
+    
+    Args:
+        path: Path to the file
+        mtime_ns: Modification time of the file, so changed files are read again
+        size: Size of the regular file in bytes
+        
+    Returns:
+        File contents as string
+    """
+    return _read_file(path, size)
+
+
+def read_file_contents(file_path: Union[str, Path]) -> str:
     """Read contents from a file.
     
+    Repeated reads of an unchanged regular file, such as a system prompt shared
+    by many runs, are served from memory.
+    
     Args:
         file_path: Path to the file
         
@@ -84,8 +167,15 @@ def read_file_contents(file_path: str) -> str:
         File contents as string
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return file.read()
+        path = Path(file_path)
+        st = path.stat()
+        # Pipes and FIFOs can only be read once, and procfs files are regular but
+        # report a size of 0 while their contents change, so neither is cached
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return _read_file(path, 0)
+        return _read_cached(path, st.st_mtime_ns, st.st_size)
     except Exception as e:
+        import typer
+        
         logger.error(f"Error reading file {file_path}: {e}")
         raise typer.BadParameter(f"Could not read file: {e}")
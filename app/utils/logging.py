@@ -6,12 +6,26 @@ from typing import Optional
 from loguru import logger
 
 
+# Level the handler is currently configured with, None until set up
+_active_level: Optional[str] = None
+
+
 def setup_logger(log_level: str = "INFO") -> None:
     """Configure logger for the application.
     
+    Logging from the app package is disabled on import, so library and test
+    use stays silent; the CLI calls this once on startup to enable it.
+    Calling it again with the level already in use only re-enables logging.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
+    global _active_level
+    logger.enable("app")
+    if log_level == _active_level:
+        return
+    _active_level = log_level
+    
     # Remove default handlers
     logger.remove()
     
@@ -23,8 +37,5 @@ def setup_logger(log_level: str = "INFO") -> None:
         colorize=True,
     )
     
-    logger.debug("Logger initialized with level: {}", log_level)
-
-
-# Initialize logger with default settings
-setup_logger()
+    if log_level.upper() == "DEBUG":
+        logger.debug("Logger initialized with level: {}", log_level)
@@ -1,53 +1,74 @@
-"""Metrics utilities for tracking API response time and token usage."""
+"""Metrics utilities for tracking API response time and token usage.
+
+Metrics are built from trusted data only: token counts typed by the OpenAI SDK
+and timestamps and model names produced by the service itself. The models are
+therefore created with ``model_construct``, skipping Pydantic validation.
+"""
 
-import time
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any
 
 from app.models.output import ResponseMetrics, TokenUsage
 
 
-def calculate_response_time(start_time: datetime, end_time: datetime) -> int:
+# Reads the three token counts from a usage dictionary in a single call
+_get_token_counts = itemgetter("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def calculate_response_time(start_ns: int, end_ns: int) -> int:
     """Calculate response time in milliseconds.
     
+    Works on integer nanosecond readings, such as those from
+    ``time.perf_counter_ns()``, so no ``timedelta`` or float conversion is needed.
+    
     Args:
-        start_time: Start time of the request
-        end_time: End time of the request
+        start_ns: Clock reading in nanoseconds at the start of the request
+        end_ns: Clock reading in nanoseconds at the end of the request
         
     Returns:
         Response time in milliseconds
     """
-    delta = end_time - start_time
-    return int(delta.total_seconds() * 1000)
+    return (end_ns - start_ns) // 1_000_000
 
 
 def create_response_metrics(
     start_time: datetime,
-    end_time: datetime,
+    response_time_ms: int,
     usage: Dict[str, int],
     model: str,
 ) -> ResponseMetrics:
     """Create response metrics from raw data.
     
+    ResponseMetrics derives the end time from the start time and the response
+    time, which callers measure with a monotonic clock rather than a second
+    wall-clock read.
+    
     Args:
         start_time: Start time of the request
-        end_time: End time of the request
+        response_time_ms: Response time in milliseconds
         usage: Token usage dictionary from OpenAI response
         model: Model name used for the request
         
     Returns:
         ResponseMetrics object
     """
-    token_usage = TokenUsage(
-        prompt_tokens=usage.get("prompt_tokens", 0),
-        completion_tokens=usage.get("completion_tokens", 0),
-        total_tokens=usage.get("total_tokens", 0),
+    try:
+        prompt_tokens, completion_tokens, total_tokens = _get_token_counts(usage)
+    except KeyError:
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+        total_tokens = usage.get("total_tokens", 0)
+    
+    token_usage = TokenUsage.model_construct(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=total_tokens,
     )
     
-    return ResponseMetrics(
+    return ResponseMetrics.model_construct(
         start_time=start_time,
-        end_time=end_time,
-        response_time_ms=calculate_response_time(start_time, end_time),
+        response_time_ms=response_time_ms,
         token_usage=token_usage,
         model=model,
     )